@@ -1,15 +1,219 @@
 """Flask backend for the Blog API providing GET, POST, PUT, DELETE, and SEARCH endpoints for blog posts."""
 
-from flask import Flask, jsonify, request
+import dataclasses
+import functools
+import json
+import threading
+import uuid
+from operator import itemgetter
+
+from flask import Flask, request
 from flask_cors import CORS
 
+# orjson and msgspec are CPython-only; under PyPy the stdlib json fallbacks below are used instead
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 app = Flask(__name__)
+# Match '/api/posts/' as well as '/api/posts' without a redirect round trip
+app.url_map.strict_slashes = False
 CORS(app)  # This will enable CORS for all routes
 
+
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj):
+        """Encode obj as compact JSON bytes with the stdlib encoder."""
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def ojsonify(obj, status=200):
+    """Build a JSON response for obj, encoded with orjson when available."""
+    return app.response_class(_dumps(obj), status=status, mimetype='application/json')
+
+
+# Posts encoded per streamed chunk; large enough to keep writes few, small enough to bound memory
+_STREAM_BATCH = 256
+
+
+def _stream_posts(posts):
+    """Yield the public form of posts as a JSON array, encoding _STREAM_BATCH posts per chunk."""
+    separator = b'['
+    for start in range(0, len(posts), _STREAM_BATCH):
+        batch = _dumps([_public(post) for post in posts[start:start + _STREAM_BATCH]])
+        # Strip the batch's own brackets so the chunks join into one array
+        yield separator + batch[1:-1]
+        separator = b','
+    yield b']' if separator == b',' else b'[]'
+
+
+def ojsonify_posts(posts):
+    """Build a streamed JSON array response of the public form of posts."""
+    return app.response_class(_stream_posts(posts), mimetype='application/json')
+
+
+def _versioned(version, build):
+    """Tag a response with a weak ETag for the posts version, answering 304 if the client already has it.
+
+    Args:
+        version (int): The posts version the response body reflects.
+        build (callable): Builds the full response; only called when the client's copy is stale.
+    """
+    etag = f'{_ETAG_PREFIX}-{version}'
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = build()
+    response.set_etag(etag, weak=True)
+    return response
+
+
+if msgspec is not None:
+    class PostIn(msgspec.Struct):
+        """Request body for creating a post; both fields are required."""
+
+        title: str
+        content: str
+
+    class PostPatch(msgspec.Struct, omit_defaults=True):
+        """Request body for updating a post; omitted fields are left unchanged."""
+
+        title: str | None = None
+        content: str | None = None
+
+    DecodeError = msgspec.DecodeError
+
+    def _decode(body, struct_type):
+        """Decode and validate a JSON body into the given struct type in one pass."""
+        return msgspec.json.decode(body, type=struct_type)
+else:
+    @dataclasses.dataclass
+    class PostIn:
+        """Request body for creating a post; both fields are required."""
+
+        title: str
+        content: str
+
+    @dataclasses.dataclass
+    class PostPatch:
+        """Request body for updating a post; omitted fields are left unchanged."""
+
+        title: str | None = None
+        content: str | None = None
+
+    class DecodeError(ValueError):
+        """Raised when a request body is not valid JSON or does not match the expected fields."""
+
+    def _decode(body, struct_type):
+        """Decode a JSON body with the stdlib json module and check it against the dataclass fields."""
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            raise DecodeError(str(e)) from e
+        if not isinstance(data, dict):
+            raise DecodeError('Expected `object`')
+        values = {}
+        for field in dataclasses.fields(struct_type):
+            if field.name not in data:
+                if field.default is dataclasses.MISSING:
+                    raise DecodeError(f'Object missing required field `{field.name}`')
+                continue
+            value = data[field.name]
+            if not isinstance(value, str) and not (value is None and field.default is None):
+                raise DecodeError(f'Expected `str` - at `$.{field.name}`')
+            values[field.name] = value
+        return struct_type(**values)
+
+
+# Posts in creation order. Only appends and removals touch the list, and ids only ever grow,
+# so ids stay strictly increasing along POSTS.
 POSTS = [
     {"id": 1, "title": "First post", "content": "This is the first post."},
     {"id": 2, "title": "Second post", "content": "This is the second post."},
 ]
+_PUBLIC_FIELDS = ('id', 'title', 'content')
+# Sortable fields mapped to the key extractor for their cached lowercase copy
+_SORT_KEYS = {'title': itemgetter('_title_lc'), 'content': itemgetter('_content_lc')}
+_SORT_DIRECTIONS = frozenset(('asc', 'desc'))
+
+
+def _index_post(post):
+    """Cache the lowercased title and content on a post for case-insensitive matching."""
+    post['_title_lc'] = post['title'].lower()
+    post['_content_lc'] = post['content'].lower()
+
+
+def _public(post):
+    """Return a copy of a post without the cached search fields."""
+    return {field: post[field] for field in _PUBLIC_FIELDS}
+
+
+for _post in POSTS:
+    _index_post(_post)
+
+# Index of POSTS by id for O(1) lookup; kept in sync on create and delete
+POSTS_BY_ID = {post['id']: post for post in POSTS}
+# Next free post id; advanced under _posts_lock so concurrent creates never collide
+_next_id = max((post['id'] for post in POSTS), default=0) + 1
+_posts_lock = threading.Lock()
+# Bumped on every create/update/delete; part of each memoized key so stale entries are never served
+_posts_version = 0
+# Scopes ETags to this process, since _posts_version restarts at 0 along with POSTS
+_ETAG_PREFIX = uuid.uuid4().hex[:8]
+# (version, body) of the serialized unsorted listing; reset to None before _posts_version is bumped
+_posts_json_cache = None
+
+
+def _posts_json():
+    """Return the posts version and JSON-encoded unsorted post list, rebuilding them if POSTS changed.
+
+    The body is cached together with the version it was encoded from, so an ETag taken from the
+    pair always describes exactly that body.
+    """
+    global _posts_json_cache
+    cached = _posts_json_cache
+    if cached is None:
+        with _posts_lock:
+            # Another request may have rebuilt it while this one waited for the lock
+            cached = _posts_json_cache
+            if cached is None:
+                cached = _posts_json_cache = (_posts_version, _dumps([_public(post) for post in POSTS]))
+    return cached
+
+
+@functools.lru_cache(maxsize=16)
+def _sorted_posts(sort_field, reverse, version):
+    """Return POSTS sorted by the given field as a tuple, memoized per posts version."""
+    return tuple(sorted(POSTS, key=_SORT_KEYS[sort_field], reverse=reverse))
+
+
+@functools.lru_cache(maxsize=256)
+def _search_posts(title_query, content_query, version):
+    """Return the posts matching the lowercased queries as a tuple, memoized per posts version."""
+    # Branch once on which queries are set so each loop only tests what it needs
+    if title_query and content_query:
+        return tuple(
+            post for post in POSTS
+            if title_query in post['_title_lc'] or content_query in post['_content_lc']
+        )
+    if title_query:
+        return tuple(post for post in POSTS if title_query in post['_title_lc'])
+    if content_query:
+        return tuple(post for post in POSTS if content_query in post['_content_lc'])
+    return tuple(POSTS)
+
+
+def _unsorted_posts_response():
+    """Serve the cached unsorted listing, tagged with the version it was encoded from."""
+    version, body = _posts_json()
+    return _versioned(version, lambda: app.response_class(body, mimetype='application/json'))
 
 
 @app.route('/api/posts', methods=['GET'])
@@ -29,6 +233,8 @@ def get_posts():
             - If 'direction' not in ('asc', 'desc'), returns 400 with error.
             - Otherwise, returns posts sorted case-insensitive by the given field and direction.
 
+    Responses carry a weak ETag of the posts version; a matching If-None-Match gets 304 with no body.
+
     Returns:
         Response: JSON list of blog posts (possibly sorted), or error with status 400 for invalid parameters.
     """
@@ -36,18 +242,19 @@ def get_posts():
     direction = request.args.get('direction', 'asc')
     # If neither 'sort' nor 'direction' is set, return original order
     if sort_field is None and 'direction' not in request.args:
-        return jsonify(POSTS)
+        return _unsorted_posts_response()
     # If sort_field is set, validate and sort
     if sort_field is not None:
-        if sort_field not in ('title', 'content'):
-            return jsonify({'error': 'Invalid sort field. Allowed: title, content'}), 400
-        if direction.lower() not in ('asc', 'desc'):
-            return jsonify({'error': 'Invalid direction. Allowed: asc, desc'}), 400
-        reverse = direction.lower() == 'desc'
-        result = sorted(POSTS, key=lambda p: p[sort_field].lower(), reverse=reverse)
-        return jsonify(result), 200
+        if sort_field not in _SORT_KEYS:
+            return ojsonify({'error': 'Invalid sort field. Allowed: title, content'}, 400)
+        direction = direction.lower()
+        if direction not in _SORT_DIRECTIONS:
+            return ojsonify({'error': 'Invalid direction. Allowed: asc, desc'}, 400)
+        reverse = direction == 'desc'
+        version = _posts_version
+        return _versioned(version, lambda: ojsonify_posts(_sorted_posts(sort_field, reverse, version)))
     # If only direction is set, but not sort, ignore and return original order
-    return jsonify(POSTS)
+    return _unsorted_posts_response()
 
 
 @app.route('/api/posts/search', methods=['GET'])
@@ -59,19 +266,13 @@ def search_posts():
         content (str, optional): Substring to search for in the post contents.
 
     Returns:
-        Response: JSON list of matching blog posts with status 200.
+        Response: JSON list of matching blog posts with status 200,
+                  or status 304 if If-None-Match matches the current posts version.
     """
+    version = _posts_version
     title_query = request.args.get('title', '').lower()
     content_query = request.args.get('content', '').lower()
-    if not title_query and not content_query:
-        result = POSTS
-    else:
-        result = [
-            post for post in POSTS
-            if (title_query and title_query in post['title'].lower()) or
-               (content_query and content_query in post['content'].lower())
-        ]
-    return jsonify(result), 200
+    return _versioned(version, lambda: ojsonify_posts(_search_posts(title_query, content_query, version)))
 
 
 # Neue Route für POST /api/posts
@@ -83,24 +284,27 @@ def create_post():
 
     Returns:
         Response: JSON of the created post with status 201 on success,
-                  or error message with status 400 if data is missing.
+                  or error message with status 400 if data is missing or invalid.
     """
-    data = request.get_json()
-    missing = [field for field in ('title', 'content') if not data or field not in data]
-    if missing:
-        return jsonify({'error': f"Missing fields: {missing}"}), 400
-    # new ID gen
-    if POSTS:
-        new_id = max(post['id'] for post in POSTS) + 1
-    else:
-        new_id = 1
-    new_post = {
-        'id': new_id,
-        'title': data['title'],
-        'content': data['content']
-    }
-    POSTS.append(new_post)
-    return jsonify(new_post), 201
+    global _next_id, _posts_version, _posts_json_cache
+    try:
+        data = _decode(request.get_data(), PostIn)
+    except DecodeError as e:
+        return ojsonify({'error': str(e)}, 400)
+    with _posts_lock:
+        new_id = _next_id
+        _next_id += 1
+        new_post = {
+            'id': new_id,
+            'title': data.title,
+            'content': data.content
+        }
+        _index_post(new_post)
+        POSTS.append(new_post)
+        POSTS_BY_ID[new_id] = new_post
+        _posts_json_cache = None
+        _posts_version += 1
+    return ojsonify(_public(new_post), 201)
 
 
 @app.route('/api/posts/<int:post_id>', methods=['PUT'])
@@ -112,17 +316,32 @@ def update_post(post_id):
 
     Returns:
         Response: JSON of the updated post with status 200 if successful,
-                  or error message with status 404 if post not found.
+                  error message with status 404 if post not found,
+                  or error message with status 400 if the body is invalid.
     """
-    data = request.get_json(silent=True) or {}
-    post = next((post for post in POSTS if post['id'] == post_id), None)
+    global _posts_version, _posts_json_cache
+    post = POSTS_BY_ID.get(post_id)
     if post is None:
-        return jsonify({'error': 'Post not found'}), 404
-    if 'title' in data:
-        post['title'] = data['title']
-    if 'content' in data:
-        post['content'] = data['content']
-    return jsonify(post), 200
+        return ojsonify({'error': 'Post not found'}, 404)
+    body = request.get_data()
+    try:
+        data = _decode(body, PostPatch) if body else PostPatch()
+    except DecodeError as e:
+        return ojsonify({'error': str(e)}, 400)
+    with _posts_lock:
+        changed = False
+        if data.title is not None and data.title != post['title']:
+            post['title'] = data.title
+            changed = True
+        if data.content is not None and data.content != post['content']:
+            post['content'] = data.content
+            changed = True
+        # A no-op update keeps the current version, so ETags and memoized results stay valid
+        if changed:
+            _index_post(post)
+            _posts_json_cache = None
+            _posts_version += 1
+    return ojsonify(_public(post), 200)
 
 
 @app.route('/api/posts/<int:post_id>', methods=['DELETE'])
@@ -136,11 +355,16 @@ def delete_post(post_id):
         Response: JSON message confirming deletion with status 200 if found,
                   or error message with status 404 if not found.
     """
-    post_to_delete = next((post for post in POSTS if post['id'] == post_id), None)
+    global _posts_version, _posts_json_cache
+    with _posts_lock:
+        post_to_delete = POSTS_BY_ID.pop(post_id, None)
+        if post_to_delete:
+            POSTS.remove(post_to_delete)
+            _posts_json_cache = None
+            _posts_version += 1
     if not post_to_delete:
-        return jsonify({'error': 'Post not found'}), 404
-    POSTS.remove(post_to_delete)
-    return jsonify({'message': f'Post with id {post_id} has been deleted successfully.'}), 200
+        return ojsonify({'error': 'Post not found'}, 404)
+    return ojsonify({'message': f'Post with id {post_id} has been deleted successfully.'}, 200)
 
 
 if __name__ == '__main__':
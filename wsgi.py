@@ -0,0 +1,15 @@
+"""WSGI entry point for serving the Blog API backend under gunicorn with gevent workers.
+
+Run from the repository root:
+
+    gunicorn -k gevent -w 1 --worker-connections 1000 -b 0.0.0.0:5002 wsgi:app
+
+POSTS lives in process memory, so each worker would hold its own copy of the posts;
+keep a single worker and let gevent multiplex connections until posts move to a shared store.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+from backend.backend_app import app  # noqa: E402